@@ -27,7 +27,7 @@ Aliased moodule. See the same file in the nextcord folder for more information
 Autogenerated by aliasgen.py
 """
 
-from nextcord.voice_client import Any, AudioPlayer, AudioSource, Callable, ClientException, ConnectionClosed, DiscordVoiceWebSocket, DiscordWebSocket, ExponentialBackoff, KeepAliveHandler, List, MISSING, Optional, ReconnectWebSocket, TYPE_CHECKING, Tuple, VoiceClient, VoiceKeepAliveHandler, VoiceProtocol, _log, annotations, asyncio, has_nacl, logging, opus, socket, struct, threading, utils
+from nextcord.voice_client import Any, AudioPlayer, AudioSource, Callable, ClientException, ConnectionClosed, DiscordVoiceWebSocket, DiscordWebSocket, ExponentialBackoff, KeepAliveHandler, List, MISSING, Optional, ReconnectWebSocket, TYPE_CHECKING, Tuple, VoiceClient, VoiceKeepAliveHandler, VoiceProtocol, _RTP_HEADER, _log, annotations, asyncio, has_nacl, logging, opus, socket, struct, threading, utils
 __all__ = ("VoiceProtocol", "VoiceClient")
 
 if has_nacl:
@@ -832,6 +832,10 @@ class DiscordVoiceWebSocket:
             _log.info('Voice RESUME succeeded.')
         elif op == self.SESSION_DESCRIPTION:
             self._connection.mode = data['mode']
+            # resolve the encryption method once here instead of for every packet
+            self._connection._encrypt_packet = getattr(
+                self._connection, "_encrypt_" + data["mode"]
+            )
             await self.load_secret_key(data)
         elif op == self.HELLO:
             interval = data['heartbeat_interval'] / 1000.0
@@ -888,6 +892,8 @@ class DiscordVoiceWebSocket:
     async def load_secret_key(self, data):
         _log.info('received secret key for voice connection')
         self.secret_key = self._connection.secret_key = data.get('secret_key')
+        if self.secret_key is not None:
+            self._connection._update_box()
         await self.speak()
         await self.speak(False)
 
@@ -86,6 +86,10 @@ __all__ = (
 
 _log = logging.getLogger(__name__)
 
+# version/flags, payload type, sequence, timestamp, ssrc
+_RTP_HEADER = struct.Struct(">BBHII")
+
+
 class VoiceProtocol:
     """A class that represents the Discord voice protocol.
 
@@ -246,6 +250,8 @@ class VoiceClient(VoiceProtocol):
         self._voice_server_complete: asyncio.Event = asyncio.Event()
 
         self.mode: str = MISSING
+        self._encrypt_packet: Callable[[bytes, Any], bytes] = MISSING
+        self._box: nacl.secret.SecretBox = MISSING
         self._connections: int = 0
         self.sequence: int = 0
         self.timestamp: int = 0
@@ -522,33 +528,30 @@ class VoiceClient(VoiceProtocol):
     # audio related
 
     def _get_voice_packet(self, data):
-        header = bytearray(12)
-
         # Formulate rtp header
-        header[0] = 0x80
-        header[1] = 0x78
-        struct.pack_into('>H', header, 2, self.sequence)
-        struct.pack_into('>I', header, 4, self.timestamp)
-        struct.pack_into('>I', header, 8, self.ssrc)
+        header = _RTP_HEADER.pack(0x80, 0x78, self.sequence, self.timestamp, self.ssrc)
+
+        return self._encrypt_packet(header, data)
 
-        encrypt_packet = getattr(self, '_encrypt_' + self.mode)
-        return encrypt_packet(header, data)
+    def _update_box(self) -> None:
+        # the box only depends on the key, so build it once rather than per packet
+        self._box = nacl.secret.SecretBox(bytes(self.secret_key))
 
     def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        box = self._box
         nonce = bytearray(24)
         nonce[:12] = header
 
         return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext
 
     def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        box = self._box
         nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
 
         return header + box.encrypt(bytes(data), nonce).ciphertext + nonce
 
     def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        box = self._box
         nonce = bytearray(24)
 
         nonce[:4] = struct.pack('>I', self._lite_nonce)